@@ -14,19 +14,28 @@ project on GitHub for download.
 """
 
 # Python specific imports
+import io
+import json
 import os
 import sys
 from pathlib import Path
 import random
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from datetime import datetime as dt
-from datetime import timedelta
 from dotenv import load_dotenv
 
 # Data specific imports
 import minio
 import duckdb
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from faker import Faker
 from user_agents import parse
 
@@ -67,16 +76,38 @@ log = logging.getLogger(__name__)
 
 # Constants
 num_rows = int(os.getenv('NUM_ROWS', 8000))
+num_workers = int(os.getenv('NUM_WORKERS') or os.cpu_count() or 1)
+chunk_size = int(os.getenv('CHUNK_SIZE', 1000))
 start_datetime = dt.strptime(
     os.getenv('START_DATETIME', '2022-01-01 10:30'), '%Y-%m-%d %H:%M')
 end_datetime = dt.strptime(
     os.getenv('END_DATETIME', '2024-12-31 23:59'), '%Y-%m-%d %H:%M')
 valid_statuses = ['pending', 'completed', 'failed']
+timestamp_columns = ['login_time', 'logout_time', 'account_created',
+                     'account_updated', 'account_deleted']
+product_names = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta",
+                 "Theta", "Iota", "Kappa", "Lambda", "Mu", "Nu", "Xi",
+                 "Omicron", "Pi", "Rho", "Sigma", "Tau", "Upsilon", "Phi",
+                 "Chi", "Psi", "Omega"]
+
+# Faker providers sampled from pre-generated pools rather than per row.
+# Name pools are larger because emails are built from them and
+# deduplicated, so a small pool would drop more rows during cleaning.
+faker_pool_sizes = {
+    'first_name': 5000,
+    'last_name': 5000,
+    'address': 1000,
+    'state': 1000,
+    'company': 1000,
+    'job': 1000,
+    'user_agent': 1000
+}
 
 # Configure Faker
 fake = Faker()
 Faker.seed(42)
 random.seed(42)
+np.random.seed(42)
 
 # S3 Configuration
 S3_CONFIG = {
@@ -92,97 +123,112 @@ S3_CONFIG = {
 S3_URL = f"s3://{S3_CONFIG['bucket']}/cleaned_data.json"
 
 
-def generate_data():
-    """Generate and save fake data to JSON, Parquet, and CSV files."""
-    try:
-        data = []
-        # Add data validation during generation
-        for _ in range(num_rows):
-            # Persist user data for each record
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-
-            # Generates data around account creation, deletion and updates
-            is_active = 1 if random.random() < 0.8 else 0
-            account_created = fake.date_time_between(
-                start_date=start_datetime, end_date=end_datetime)
-            account_updated = fake.date_time_between(
-                start_date=account_created, end_date=end_datetime)
-            account_deleted = fake.date_time_between(
-                start_date=account_updated, end_date=end_datetime) if is_active == 0 else None
-
-            # Generates login and logout times for each record
-            login_time = fake.date_time_between(
-                start_date=account_created,
-                end_date=account_deleted if account_deleted else end_datetime
-            )
+def build_faker_pools():
+    """Pre-generate a pool of values for each pooled Faker provider."""
+    Faker.seed(42)
+    return {
+        provider: np.array(
+            [getattr(fake, provider)() for _ in range(size)], dtype=object)
+        for provider, size in faker_pool_sizes.items()
+    }
 
-            # This guarantees that logout time is always .5 to 4 hours after login time
-            logout_time = login_time + timedelta(hours=random.uniform(0.5, 4))
-
-            # Calculates session duration in minutes
-            session_duration = (logout_time - login_time).total_seconds() / 60
-
-            record = {
-                "user_id": fake.uuid4(),
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": f"{first_name}_{last_name}@example.com",
-                "date_of_birth": fake.date_of_birth(minimum_age=18, maximum_age=72).isoformat(),
-                "phone_number": fake.phone_number(),
-                "address": fake.address(),
-                "city": fake.city(),
-                "state": fake.state(),
-                "postal_code": fake.postcode(),
-                "country": fake.country(),
-                "company": fake.company(),
-                "job_title": fake.job(),
-                "ip_address": fake.ipv4(),
-                "is_active": is_active,
-                "login_time": login_time.isoformat(),
-                "logout_time": logout_time.isoformat(),
-                "account_created": account_created.isoformat(),
-                "account_updated": account_updated.isoformat(),
-                "account_deleted": account_deleted.isoformat() if account_deleted else None,
-                "session_duration_minutes": round(session_duration, 2),
-                "product_id": fake.uuid4(),
-                "product_name": fake.random_element(["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta", "Theta", "Iota", "Kappa", "Lambda", "Mu", "Nu", "Xi", "Omicron", "Pi", "Rho", "Sigma", "Tau", "Upsilon", "Phi", "Chi", "Psi", "Omega"]),
-                "price": round(fake.pyfloat(min_value=100, max_value=5000, right_digits=2), 2),
-                "purchase_status": fake.random_element(["completed", "pending", "failed"]),
-                "user_agent": fake.user_agent()
-            }
 
-            # Validate record before adding
-            if not all([
-                record['login_time'] < record['logout_time'],
-                record['account_created'] <= record['account_updated'],
-                record['price'] > 0
-            ]):
-                continue
+def _generate_chunk(seed, n, pools):
+    """Generate n fake user activity records in a worker process."""
+    # Reseed per chunk so output doesn't depend on which worker runs it
+    Faker.seed(seed)
+    random.seed(seed)
+    np.random.seed(seed)
+
+    # Bounds for all generated timestamps, as unix seconds
+    start_ts = pd.Timestamp(start_datetime).value // 10**9
+    end_ts = pd.Timestamp(end_datetime).value // 10**9
+
+    # Generates data around account creation, deletion and updates
+    is_active = (np.random.random(n) < 0.8).astype(np.int8)
+    account_created = np.random.randint(start_ts, end_ts + 1, n)
+    account_updated = np.random.randint(account_created, end_ts + 1)
+    account_deleted = np.random.randint(account_updated, end_ts + 1)
+
+    # Generates login times between account creation and deletion
+    session_end = np.where(is_active == 1, end_ts, account_deleted)
+    login_time = np.random.randint(account_created, session_end + 1)
+
+    # This guarantees that logout time is always .5 to 4 hours after login time
+    logout_time = login_time + \
+        (np.random.uniform(0.5, 4, n) * 3600).astype(np.int64)
+
+    # Users are between 18 and 72 years old, using calendar years so
+    # leap days never produce a 17-year-old
+    today = pd.Timestamp(dt.now().date())
+    youngest_dob = np.datetime64(today - pd.DateOffset(years=18), 'D')
+    oldest_dob = np.datetime64(today - pd.DateOffset(years=73), 'D') + 1
+    date_of_birth = oldest_dob + np.random.randint(
+        0, (youngest_dob - oldest_dob).astype(np.int64) + 1, n)
+
+    # Low-cardinality Faker fields are sampled from the shared pools
+    sampled = {provider: np.random.choice(pool, n)
+               for provider, pool in pools.items()}
+
+    df = pd.DataFrame({
+        "user_id": [fake.uuid4() for _ in range(n)],
+        "first_name": sampled['first_name'],
+        "last_name": sampled['last_name'],
+        "email": (sampled['first_name'] + '_' + sampled['last_name']
+                  + '@example.com'),
+        "date_of_birth": np.datetime_as_string(date_of_birth),
+        "address": sampled['address'],
+        "state": sampled['state'],
+        "company": sampled['company'],
+        "job_title": sampled['job'],
+        "ip_address": [fake.ipv4() for _ in range(n)],
+        "is_active": is_active,
+        "login_time": login_time.astype('datetime64[s]'),
+        "logout_time": logout_time.astype('datetime64[s]'),
+        "account_created": account_created.astype('datetime64[s]'),
+        "account_updated": account_updated.astype('datetime64[s]'),
+        "account_deleted": np.where(
+            is_active == 1, np.datetime64('NaT'),
+            account_deleted.astype('datetime64[s]')),
+        "session_duration_minutes": np.round(
+            (logout_time - login_time) / 60, 2),
+        "product_name": np.random.choice(product_names, n),
+        "price": np.round(np.random.uniform(100, 5000, n), 2),
+        "purchase_status": np.random.choice(valid_statuses, n),
+        "user_agent": sampled['user_agent']
+    })
+
+    # Validate records before keeping them
+    df = df[
+        (df['login_time'] < df['logout_time'])
+        & (df['account_created'] <= df['account_updated'])
+        & (df['price'] > 0)
+    ].reset_index(drop=True)
 
-            data.append(record)
+    return df
 
-        # Add basic statistics logging
-        log.info("Generated %s records", num_rows)
-        log.info("Active users: %s", sum(1 for r in data if r['is_active']))
-        log.info("Average price: $%s", sum(r['price'] for r in data)/len(data))
 
-        return data
+def generate_chunks():
+    """Yield generated data chunks in order as the worker pool finishes them."""
+    # Split the rows into fixed-size chunks, each with its own seed
+    chunk_sizes = [min(chunk_size, num_rows - start)
+                   for start in range(0, num_rows, chunk_size)]
+    seeds = [42 + chunk_idx for chunk_idx in range(len(chunk_sizes))]
+    pools = build_faker_pools()
+    workers = max(1, min(num_workers, len(chunk_sizes)))
 
-    except Exception as e:
-        log.error("Error generating data: %s", str(e))
-        raise
+    # The pool keeps generating later chunks while the caller cleans
+    # earlier ones, so cleaning overlaps with generation
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            _generate_chunk, seeds, chunk_sizes, repeat(pools))
 
 
-def validate_timestamps(row):
-    """Function validates the timestamps for the login and logout times, to ensure consistency."""
-    try:
-        login = pd.to_datetime(row['login_time'])
-        logout = pd.to_datetime(row['logout_time'])
-        return pd.notnull(login) and pd.notnull(logout) and login <= logout
-    except (ValueError, TypeError, pd.errors.OutOfBoundsDatetime) as e:
-        log.error("Error validating timestamps for row %s: %s", row.name, str(e))
-        return False
+def _valid_mask(df):
+    """Return a boolean mask of rows whose login time is at or before logout."""
+    login = df['login_time']
+    logout = df['logout_time']
+    return login.notna() & logout.notna() & (login <= logout)
 
 
 def save_data_formats(df, project_root):
@@ -198,7 +244,9 @@ def save_data_formats(df, project_root):
 
         df.to_csv(csv_path, index=False)
         df.to_json(json_path, orient='records', date_format='iso')
-        df.to_parquet(parquet_path, index=False)
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False), parquet_path,
+            row_group_size=50_000, compression='zstd', use_dictionary=True)
 
         log.info("Data saved in CSV, JSON, and Parquet formats")
         return csv_path, json_path, parquet_path
@@ -207,7 +255,32 @@ def save_data_formats(df, project_root):
         raise
 
 
-def prepare_data():
+def read_raw_csv(csv_path):
+    """Read raw CSV data with pyarrow's multithreaded reader."""
+    # Type timestamps on ingest so they arrive as datetime64
+    column_types = {col: pa.timestamp('us') for col in timestamp_columns}
+    column_types['date_of_birth'] = pa.string()
+
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(column_types=column_types)
+    )
+    return table.to_pandas()
+
+
+def clean_chunk(df):
+    """Parse timestamps and run both cleaning passes over one raw chunk."""
+    # Parse timestamps once; later stages rely on datetime64 columns
+    df[timestamp_columns] = df[timestamp_columns].apply(
+        pd.to_datetime, format='ISO8601', errors='coerce')
+
+    df = process_basic_cleaning(df)
+    return process_advanced_cleaning(df)
+
+
+def prepare_data(chunks=None):
     """Function prepares the generated data for cleaning and loading."""
     try:
         # Get the project root directory and setup paths
@@ -216,10 +289,38 @@ def prepare_data():
         db_dir = project_root / 'dbt_pipeline_demo' / 'databases'
         db_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load and process data
-        df = pd.read_csv(data_dir / 'simulated_api_data.csv')
-        df = process_basic_cleaning(df)
-        df = process_advanced_cleaning(df)
+        # Load and process data, cleaning each raw chunk as it arrives;
+        # without chunks, fall back to the raw Parquet file, then the CSV
+        if chunks is None:
+            parquet_path = data_dir / 'simulated_api_data.parquet'
+            if parquet_path.exists():
+                chunks = [pd.read_parquet(parquet_path)]
+            else:
+                chunks = [read_raw_csv(data_dir / 'simulated_api_data.csv')]
+
+        # Record raw statistics before each chunk is cleaned in place
+        raw_records = active_users = 0
+        total_price = 0.0
+        cleaned = []
+        seen_emails = set()
+        for chunk in chunks:
+            raw_records += len(chunk)
+            active_users += int((chunk['is_active'] == 1).sum())
+            total_price += chunk['price'].sum()
+
+            # Drop emails already seen in earlier raw chunks before any
+            # filtering, matching a first-wins dedup over the whole frame
+            emails = chunk['email'].str.strip()
+            chunk = chunk[~emails.isin(seen_emails)].copy()
+            seen_emails.update(emails)
+            cleaned.append(clean_chunk(chunk))
+
+        # Add basic statistics logging
+        log.info("Generated %s records", raw_records)
+        log.info("Active users: %s", active_users)
+        log.info("Average price: $%s", total_price / max(raw_records, 1))
+
+        df = pd.concat(cleaned, ignore_index=True)
 
         # Save metrics and data
         save_metrics(df, project_root)
@@ -235,16 +336,21 @@ def prepare_data():
 def process_basic_cleaning(df):
     """Handle basic data cleaning operations."""
     # Generate transaction ID
-    df['transact_id'] = df.apply(
-        lambda row: f"txn_{row['user_id']}_{pd.to_datetime(
-            row['login_time']).strftime('%Y%m%d%H%M%S')}"
-        if pd.notnull(row['login_time']) else None,
-        axis=1
-    )
+    df['transact_id'] = 'txn_' + df['user_id'].astype(str) + '_' + \
+        df['login_time'].dt.strftime('%Y%m%d%H%M%S')
+    df.loc[df['login_time'].isna(), 'transact_id'] = None
 
-    # Basic cleaning steps
+    # Basic cleaning steps, trimming strings with pyarrow's compute kernel
     for col in df.select_dtypes(include=['object']).columns:
-        df[col] = df[col].str.strip()
+        try:
+            values = pa.array(df[col], from_pandas=True)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            # Mixed-type columns keep pandas' behaviour of NaN for non-strings
+            df[col] = df[col].str.strip()
+            continue
+        if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+            df[col] = pc.utf8_trim_whitespace(values).to_numpy(
+                zero_copy_only=False)
 
     df = df.drop_duplicates(subset=['email'])
 
@@ -254,7 +360,7 @@ def process_basic_cleaning(df):
     df = df.drop([col for col in drop_columns if col in df.columns], axis=1)
 
     df['country'] = 'United States'
-    df['is_active'] = df['is_active'].replace({0: 'no', 1: 'yes'})
+    df['is_active'] = np.where(df['is_active'] == 1, 'yes', 'no')
 
     return df[['user_id', 'transact_id', 'first_name', 'last_name', 'email',
               'date_of_birth', 'address', 'state', 'country',
@@ -264,18 +370,28 @@ def process_basic_cleaning(df):
                'user_agent']]
 
 
+@lru_cache(maxsize=None)
+def parse_user_agent(ua):
+    """Parse a user agent string, memoized across cleaning chunks."""
+    return parse(ua)
+
+
 def process_advanced_cleaning(df):
     """Handle advanced data processing and validation."""
-    # Process user agent data
-    df[['device_type', 'os', 'browser']] = df['user_agent'].apply(lambda ua: pd.Series({
-        'device_type': parse(ua).device.family,
-        'os': parse(ua).os.family,
-        'browser': parse(ua).browser.family
-    }))
-    df['device_type'] = df['device_type'].str.replace('Other', 'Desktop')
+    # Process user agent data, parsing each distinct user agent only once
+    # per run since the cache is shared by every chunk
+    parsed = {ua: parse_user_agent(ua) for ua in df['user_agent'].unique()}
+    df['device_type'] = df['user_agent'].map(
+        {ua: p.device.family for ua, p in parsed.items()})
+    df['os'] = df['user_agent'].map(
+        {ua: p.os.family for ua, p in parsed.items()})
+    df['browser'] = df['user_agent'].map(
+        {ua: p.browser.family for ua, p in parsed.items()})
+    df['device_type'] = df['device_type'].where(
+        df['device_type'] != 'Other', 'Desktop')
 
     # Validate and filter data
-    df = df[df.apply(validate_timestamps, axis=1)]
+    df = df[_valid_mask(df)]
     df['price'] = pd.to_numeric(df['price'], errors='coerce')
     df = df[df['price'] > 0]
 
@@ -286,13 +402,6 @@ def process_advanced_cleaning(df):
 
 def add_analysis_fields(df):
     """Add additional analysis fields to the dataframe."""
-    # Ensure datetime columns are properly formatted
-    date_columns = ['account_created', 'login_time',
-                    'logout_time', 'account_updated', 'account_deleted']
-    for col in date_columns:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
-
     # Safe string format for cohort date
     df['cohort_date'] = df['account_created'].dt.strftime('%Y-%m')
 
@@ -307,24 +416,32 @@ def add_analysis_fields(df):
         labels=['Very Low', 'Low', 'Medium', 'High']
     )
 
-    # Handle potential empty groups in qcut
-    try:
-        df['price_tier'] = pd.qcut(
-            df['price'],
-            q=4,
-            labels=['Budget', 'Standard', 'Premium', 'Luxury']
-        )
-    except ValueError:
-        # Fallback if not enough distinct values
-        df['price_tier'] = 'Standard'
-
-    # Safe CLV calculation
-    user_purchases = df.groupby(
-        'user_id')['price'].sum().fillna(0).reset_index()
-    df = df.merge(user_purchases, on='user_id',
-                  suffixes=('', '_total'), how='left')
-    df['customer_lifetime_value'] = df['price_total'].fillna(0)
-    df = df.drop('price_total', axis=1)
+    # Price tiers and CLV are window functions in one DuckDB scan. Ties on
+    # price are broken by user and row so tiers are stable between runs,
+    # and results are returned by row position to keep the input order.
+    with duckdb.connect() as conn:
+        conn.register('activity', df[['user_id', 'price']].assign(
+            row_idx=np.arange(len(df))))
+        derived = conn.execute("""
+            SELECT
+                CASE NTILE(4) OVER (ORDER BY price, user_id, row_idx)
+                    WHEN 1 THEN 'Budget'
+                    WHEN 2 THEN 'Standard'
+                    WHEN 3 THEN 'Premium'
+                    ELSE 'Luxury'
+                END AS price_tier,
+                COALESCE(SUM(price) OVER (PARTITION BY user_id), 0)
+                    AS customer_lifetime_value
+            FROM activity
+            ORDER BY row_idx;
+        """).df()
+
+    df['price_tier'] = pd.Categorical(
+        derived['price_tier'].to_numpy(),
+        categories=['Budget', 'Standard', 'Premium', 'Luxury'],
+        ordered=True
+    )
+    df['customer_lifetime_value'] = derived['customer_lifetime_value'].to_numpy()
 
     return df
 
@@ -335,12 +452,18 @@ def save_metrics(df, project_root):
     metrics_dir = project_root / 'metrics'
     metrics_dir.mkdir(exist_ok=True)
 
+    # Each mask is computed once and only counted
+    duplicate_mask = df.duplicated(subset=['email'])
+    valid_mask = _valid_mask(df)
+    price_mask = df['price'] > 0
+    status_mask = df['purchase_status'].isin(valid_statuses)
+
     cleaning_metrics = {
         'initial_records': initial_count,
-        'duplicate_emails_removed': initial_count - len(df.drop_duplicates(subset=['email'])),
-        'invalid_sessions_removed': len(df[~df.apply(validate_timestamps, axis=1)]),
-        'invalid_prices_removed': len(df[df['price'] <= 0]),
-        'invalid_status_removed': len(df[~df['purchase_status'].isin(valid_statuses)])
+        'duplicate_emails_removed': int(duplicate_mask.sum()),
+        'invalid_sessions_removed': int((~valid_mask).sum()),
+        'invalid_prices_removed': int((~price_mask).sum()),
+        'invalid_status_removed': int((~status_mask).sum())
     }
 
     quality_metrics = {
@@ -351,10 +474,10 @@ def save_metrics(df, project_root):
     }
 
     timestamp = dt.now().strftime("%Y%m%d")
-    pd.DataFrame([cleaning_metrics]).to_csv(
-        metrics_dir / f'cleaning_metrics_{timestamp}.csv')
-    pd.DataFrame([quality_metrics]).to_csv(
-        metrics_dir / f'quality_metrics_{timestamp}.csv')
+    (metrics_dir / f'cleaning_metrics_{timestamp}.json').write_text(
+        json.dumps(cleaning_metrics, default=str))
+    (metrics_dir / f'quality_metrics_{timestamp}.json').write_text(
+        json.dumps(quality_metrics, default=str))
 
 
 def generate_reports(df):
@@ -371,24 +494,23 @@ def generate_reports(df):
         conn = duckdb.connect(
             str(project_root / 'dbt_pipeline_demo' / 'databases' / 'dbt_pipeline_demo.duckdb'))
 
-        # Add indexes if they don't exist - for the source table
+        # Load the source table from the analysis DataFrame, which DuckDB
+        # scans through Arrow. Timestamps stay nanosecond precision to keep
+        # the table's TIMESTAMP_NS columns. Rows are clustered by user and
+        # login time so DuckDB's per row group min/max zonemaps can prune
+        # scans, instead of ART indexes.
+        conn.register('analysis_df', df.astype(
+            {col: 'datetime64[ns]' for col in timestamp_columns}))
         conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_id ON user_activity(user_id);
-            CREATE INDEX IF NOT EXISTS idx_login_time ON user_activity(login_time);
-            CREATE INDEX IF NOT EXISTS idx_account_updated ON user_activity(account_updated);
-            CREATE INDEX IF NOT EXISTS idx_is_active ON user_activity(is_active);
+            CREATE OR REPLACE TABLE user_activity AS
+            SELECT * FROM analysis_df
+            ORDER BY user_id, login_time
         """)
+        conn.unregister('analysis_df')
+        log.info("Loaded %s rows into user_activity", len(df))
 
-        # Add indexes for the dbt models if they exist
+        # Run analytics against the dbt models if they exist
         try:
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ps_user_id ON product_schema(user_id);
-                CREATE INDEX IF NOT EXISTS idx_ps_login_time ON product_schema(login_time);
-                CREATE INDEX IF NOT EXISTS idx_ps_product_name ON product_schema(product_name);
-            """)
-            log.info("Created indexes on product_schema")
-
-            # Run all analytics after indexes are created
             analysis_results = {
                 "lifecycle_analysis": run_lifecycle_analysis(conn),
                 "purchase_analysis": run_purchase_analysis(conn),
@@ -405,7 +527,7 @@ def generate_reports(df):
 
         except duckdb.Error as e:
             log.warning(
-                "Could not create indexes or run analytics on product_schema (table may not exist yet): %s",
+                "Could not run analytics on product_schema (table may not exist yet): %s",
                 str(e)
             )
 
@@ -449,18 +571,13 @@ def upload_data(df, s3_bucket="sim-api-data"):
                              secure=False)
         log.info("Connected to MinIO")
 
-        # Get project root and create temporary directory for files
-        project_root = Path(__file__).parents[1]
-        temp_dir = project_root / 'temp'
-        temp_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save files temporarily
-        json_path = temp_dir / 'cleaned_data.json'
-        parquet_path = temp_dir / 'cleaned_data.parquet'
-
-        # Save in different formats
-        df.to_json(json_path, orient='records', date_format='iso')
-        df.to_parquet(parquet_path, index=False)
+        # Serialize both formats in memory, skipping temporary files
+        json_buffer = io.BytesIO()
+        df.to_json(json_buffer, orient='records', date_format='iso')
+        parquet_buffer = io.BytesIO()
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False), parquet_buffer,
+            row_group_size=50_000, compression='zstd', use_dictionary=True)
 
         # Ensure bucket exists
         if not client.bucket_exists(s3_bucket):
@@ -468,25 +585,20 @@ def upload_data(df, s3_bucket="sim-api-data"):
             log.info("Created bucket: %s", s3_bucket)
 
         # Upload files to S3
-        for file_path, object_name in [
-            (json_path, 'cleaned_data.json'),
-            (parquet_path, 'cleaned_data.parquet')
+        for buffer, object_name, content_type in [
+            (json_buffer, 'cleaned_data.json', 'application/json'),
+            (parquet_buffer, 'cleaned_data.parquet', 'application/octet-stream')
         ]:
-            client.fput_object(
+            buffer.seek(0)
+            client.put_object(
                 s3_bucket,
                 object_name,
-                str(file_path),
-                content_type='application/json' if object_name.endswith(
-                    '.json') else 'application/octet-stream'
+                buffer,
+                length=buffer.getbuffer().nbytes,
+                content_type=content_type
             )
             log.info("Uploaded %s to S3 bucket: %s", object_name, s3_bucket)
 
-        # Clean up temporary files
-        json_path.unlink()
-        parquet_path.unlink()
-        temp_dir.rmdir()
-        log.info("Temporary files cleaned up")
-
     except minio.error.MinioException as e:
         log.error("MinIO error: %s", str(e))
         raise
@@ -498,20 +610,22 @@ def upload_data(df, s3_bucket="sim-api-data"):
 def main():
     """Execute the main data pipeline workflow."""
     try:
-        # Generate fresh data
-        generate_data()
-
-        # Cleans data and prepares it for analysis
-        df, _ = prepare_data()
+        # Generate fresh data, cleaning each chunk as it is produced
+        df, _ = prepare_data(generate_chunks())
 
         # Add analysis fields
         df = add_analysis_fields(df)
 
-        # Generate reporting across various modalities
-        generate_reports(df)
+        # Upload to S3 in the background while reports run against DuckDB
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upload = executor.submit(upload_data, df)
 
-        # Upload cleaned data to DuckDB & S3
-        upload_data(df)
+            # Generate reporting across various modalities; the upload is
+            # joined even if reporting fails so its errors are not lost
+            try:
+                generate_reports(df)
+            finally:
+                upload.result()
 
     except (minio.error.MinioException,
             duckdb.Error, IOError, ConnectionError) as e: